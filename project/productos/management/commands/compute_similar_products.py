@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...similarity import CHUNK_SIZE, TOP_K, compute_similar_products
+
+
+class Command(BaseCommand):
+    help = "Precompute the top-K similar products for the catalog"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Rescore every product instead of only the changed ones",
+        )
+        parser.add_argument("--top-k", type=int, default=TOP_K)
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        if options["top_k"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--top-k and --chunk-size must be positive")
+
+        updated = compute_similar_products(
+            full=options["full"],
+            top_k=options["top_k"],
+            chunk_size=options["chunk_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} products"))
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.3 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('productos', '0002_productsimilarity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productsimilarity',
+            name='top_k',
+            field=models.PositiveIntegerField(default=0),
+            preserve_default=False,
+        ),
+    ]
@@ -5,4 +5,22 @@ class Product(models.Model):
     description = models.TextField()
     category = models.CharField(max_length=100)
     price = models.DecimalField(max_digits=10, decimal_places=2)
-    stock = models.IntegerField()
\ No newline at end of file
+    stock = models.IntegerField()
+
+class ProductSimilarity(models.Model):
+    """
+    Precomputed top-K similar products, keyed by product id
+    """
+    product = models.OneToOneField(
+        Product,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='similarity',
+    )
+    # Compact list of [product_id, score] pairs, best match first
+    neighbors = models.JSONField(default=list)
+    # Hash of the fields used to compute similarity, to detect changes
+    fingerprint = models.CharField(max_length=40)
+    # Number of neighbors the list was computed for
+    top_k = models.PositiveIntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,266 @@
+import hashlib
+import re
+import unicodedata
+
+import numpy as np
+from scipy import sparse
+
+from .models import Product, ProductSimilarity
+
+TOP_K = 10
+# Rows of the score matrix computed at once; memory is CHUNK_SIZE x catalog size
+CHUNK_SIZE = 256
+TEXT_WEIGHT = 0.7
+CATEGORY_WEIGHT = 0.2
+PRICE_WEIGHT = 0.1
+# Same boost the search view gives to name matches (name^2)
+NAME_BOOST = 2
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """
+    Split text into lowercase, accent-folded word tokens
+    """
+    folded = unicodedata.normalize("NFKD", text.lower())
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return [token for token in TOKEN_RE.findall(folded) if len(token) > 1]
+
+
+def fingerprint(name, description, category, price):
+    """
+    Hash of the fields that feed the similarity score
+    """
+    raw = "\0".join([name, description, category.lower(), str(price)])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def build_tfidf(documents):
+    """
+    Build an L2-normalized sublinear TF-IDF CSR matrix, one row per document
+    """
+    vocabulary = {}
+    indptr = [0]
+    indices = []
+    for tokens in documents:
+        for token in tokens:
+            indices.append(vocabulary.setdefault(token, len(vocabulary)))
+        indptr.append(len(indices))
+
+    data = np.ones(len(indices), dtype=np.float32)
+    matrix = sparse.csr_matrix(
+        (data, indices, indptr),
+        shape=(len(documents), max(len(vocabulary), 1)),
+        dtype=np.float32,
+    )
+    # Duplicate (row, token) entries are summed into raw term counts
+    matrix.sum_duplicates()
+    matrix.data = 1 + np.log(matrix.data)
+
+    n_docs = matrix.shape[0]
+    df = np.bincount(matrix.indices, minlength=matrix.shape[1])
+    idf = np.log((1 + n_docs) / (1 + df)) + 1
+    matrix = matrix @ sparse.diags(idf.astype(np.float32))
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.csr_matrix(sparse.diags(1 / norms) @ matrix, dtype=np.float32)
+
+
+def score_chunk(matrix, category_codes, log_prices, rows):
+    """
+    Dense combined scores of the given rows against the whole catalog
+    """
+    block = (matrix[rows] @ matrix.T).toarray()
+    block *= TEXT_WEIGHT
+    block += CATEGORY_WEIGHT * (category_codes[rows, None] == category_codes[None, :])
+    block += PRICE_WEIGHT * np.exp(
+        -np.abs(log_prices[rows, None] - log_prices[None, :])
+    )
+    # A product is never similar to itself
+    block[np.arange(len(rows)), rows] = -np.inf
+    return block
+
+
+def top_k_rows(block, top_k):
+    """
+    Column indices and scores of the best top_k entries of each row, best first
+    """
+    top_k = min(top_k, block.shape[1])
+    best = np.argpartition(-block, top_k - 1, axis=1)[:, :top_k]
+    scores = np.take_along_axis(block, best, axis=1)
+    order = np.argsort(-scores, axis=1, kind="stable")
+    return (
+        np.take_along_axis(best, order, axis=1),
+        np.take_along_axis(scores, order, axis=1),
+    )
+
+
+def merge_neighbors(neighbors, candidates, top_k):
+    """
+    Merge [product_id, score] lists keeping the best top_k, best first.
+
+    Scores in candidates are fresher and replace those in neighbors.
+    """
+    best = {product_id: score for product_id, score in neighbors}
+    best.update((product_id, score) for product_id, score in candidates)
+    ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+    return [[product_id, score] for product_id, score in ranked[:top_k]]
+
+
+def compute_similar_products(full=False, top_k=TOP_K, chunk_size=CHUNK_SIZE):
+    """
+    Refresh the ProductSimilarity table and return the number of rows written.
+
+    Unless full is set, only products whose fingerprint changed are scored
+    against the catalog, along with lists computed for another top_k and
+    unchanged products whose stored list references a changed or deleted
+    product, since the product that should replace it was never stored.
+    Scores are symmetric, so the same chunks are merged into the remaining
+    lists to let rescored products enter them and to refresh the scores
+    they already store for rescored products. Unchanged lists keep the
+    other scores computed with the IDF of their last run, so a periodic
+    full rebuild keeps them consistent with the current catalog.
+    """
+    products = list(
+        Product.objects.order_by("id").values_list(
+            "id", "name", "description", "category", "price"
+        )
+    )
+    if not products:
+        return 0
+
+    ids = np.array([product[0] for product in products])
+    fingerprints = [fingerprint(*product[1:]) for product in products]
+    existing = {}
+    if not full:
+        existing = {
+            similarity.product_id: similarity
+            for similarity in ProductSimilarity.objects.all()
+        }
+
+    changed = [
+        index
+        for index, product_id in enumerate(ids.tolist())
+        if product_id not in existing
+        or existing[product_id].fingerprint != fingerprints[index]
+    ]
+
+    # Lists for another top_k, or that lost a neighbor, are rescored too
+    current_ids = set(ids.tolist())
+    changed_ids = set(ids[changed].tolist())
+    for index, product_id in enumerate(ids.tolist()):
+        if product_id in changed_ids:
+            continue
+        similarity = existing[product_id]
+        if similarity.top_k != top_k or any(
+            neighbor_id in changed_ids or neighbor_id not in current_ids
+            for neighbor_id, _ in similarity.neighbors
+        ):
+            changed.append(index)
+    if not changed:
+        return 0
+    changed = np.array(sorted(changed), dtype=int)
+
+    matrix = build_tfidf(
+        [
+            tokenize(name) * NAME_BOOST + tokenize(description)
+            for _, name, description, _, _ in products
+        ]
+    )
+    _, category_codes = np.unique(
+        [product[3].lower() for product in products], return_inverse=True
+    )
+    log_prices = np.log1p(
+        np.array([max(float(product[4]), 0) for product in products])
+    )
+
+    new_neighbors = {}
+    # Best changed products for every column, to refresh unchanged lists
+    candidates = {}
+    is_changed = np.zeros(len(ids), dtype=bool)
+    is_changed[changed] = True
+
+    # Fresh scores of rescored products already stored in unchanged lists.
+    # Pairs are (column, position in changed), at most top_k per product.
+    refreshed = {}
+    position = np.full(len(ids), -1)
+    position[changed] = np.arange(len(changed))
+    index_by_id = {product_id: index for index, product_id in enumerate(ids.tolist())}
+    stored_pairs = np.array(
+        [
+            (index, position[index_by_id[neighbor_id]])
+            for index in np.flatnonzero(~is_changed).tolist()
+            for neighbor_id, _ in existing[int(ids[index])].neighbors
+            if is_changed[index_by_id[neighbor_id]]
+        ],
+        dtype=int,
+    ).reshape(-1, 2)
+    for start in range(0, len(changed), chunk_size):
+        rows = changed[start:start + chunk_size]
+        block = score_chunk(matrix, category_codes, log_prices, rows)
+
+        best, scores = top_k_rows(block, top_k)
+        for row, columns, row_scores in zip(rows, best, scores):
+            new_neighbors[int(ids[row])] = [
+                [int(ids[column]), round(float(score), 4)]
+                for column, score in zip(columns, row_scores)
+                if score != -np.inf
+            ]
+
+        if existing:
+            best, scores = top_k_rows(block[:, ~is_changed].T, top_k)
+            for column, rows_best, column_scores in zip(
+                ids[~is_changed].tolist(), best, scores
+            ):
+                # Trim after every chunk so memory stays at top_k per product
+                candidates[column] = merge_neighbors(
+                    candidates.get(column, []),
+                    [
+                        [int(ids[rows[row]]), round(float(score), 4)]
+                        for row, score in zip(rows_best, column_scores)
+                        if score != -np.inf
+                    ],
+                    top_k,
+                )
+
+            in_chunk = (stored_pairs[:, 1] >= start) & (
+                stored_pairs[:, 1] < start + len(rows)
+            )
+            for column, offset in stored_pairs[in_chunk].tolist():
+                refreshed.setdefault(int(ids[column]), []).append(
+                    [
+                        int(ids[changed[offset]]),
+                        round(float(block[offset - start, column]), 4),
+                    ]
+                )
+
+    for index in np.flatnonzero(~is_changed).tolist():
+        product_id = int(ids[index])
+        neighbors = existing[product_id].neighbors
+        merged = merge_neighbors(
+            neighbors,
+            refreshed.get(product_id, []) + candidates.get(product_id, []),
+            top_k,
+        )
+        if merged != neighbors:
+            new_neighbors[product_id] = merged
+
+    fingerprint_by_id = dict(zip(ids.tolist(), fingerprints))
+    ProductSimilarity.objects.bulk_create(
+        [
+            ProductSimilarity(
+                product_id=int(product_id),
+                neighbors=neighbors,
+                fingerprint=fingerprint_by_id[product_id],
+                top_k=top_k,
+            )
+            for product_id, neighbors in new_neighbors.items()
+        ],
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["product"],
+        update_fields=["neighbors", "fingerprint", "top_k", "updated_at"],
+    )
+    return len(new_neighbors)
@@ -0,0 +1,143 @@
+import os
+import time
+import uuid
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from elasticsearch_dsl.connections import connections
+from ..documents import ProductDocument
+from ..models import Product
+from .fake_elasticsearch import fake_elasticsearch
+
+# Test indices older than this were left behind by crashed runs
+STALE_INDEX_AGE = 60 * 60
+
+LIVE_ELASTICSEARCH = bool(os.environ.get("ELASTICSEARCH_TEST_LIVE"))
+
+# The stand-in does not emulate analyzers or relevance scoring
+requires_live_elasticsearch = skipUnless(
+    LIVE_ELASTICSEARCH, "needs a real cluster, set ELASTICSEARCH_TEST_LIVE"
+)
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class SearchIndexTestCase(TestCase):
+    """
+    TestCase that bulk-loads `index_products` into a fresh index once per class.
+
+    The index gets a unique name and ProductDocument is pointed at it through
+    a per-class alias, so parallel test workers never share documents.
+    Tests run against an in-memory Elasticsearch stand-in unless
+    ELASTICSEARCH_TEST_LIVE is set, in which case the configured cluster is
+    used. Autosync is disabled: tests that change the index go through
+    `index_documents`/`remove_documents`, and only those documents are reset
+    after each test.
+    """
+
+    index_products = []
+
+    @classmethod
+    def setUpClass(cls):
+        using = ProductDocument._get_using()
+        if LIVE_ELASTICSEARCH:
+            cls.es = connections.get_connection(using)
+            if not cls.es.ping():
+                raise ImproperlyConfigured(
+                    "ELASTICSEARCH_TEST_LIVE is set but Elasticsearch is not "
+                    f"reachable at {settings.ELASTICSEARCH_DSL['default']['hosts']}"
+                )
+        else:
+            cls.addClassCleanup(
+                connections.add_connection, using, connections.get_connection(using)
+            )
+            cls.es = fake_elasticsearch()
+            connections.add_connection(using, cls.es)
+
+        super().setUpClass()
+        try:
+            cls.set_up_index()
+        except Exception:
+            # tearDownClass is not called when setUpClass fails
+            super().tearDownClass()
+            raise
+
+    @classmethod
+    def set_up_index(cls):
+        """Create the class index behind its alias and bulk-load the products"""
+        original_name = ProductDocument._index._name
+        prefix = f"{original_name}-test-"
+        cls.remove_stale_indices(prefix)
+
+        # Unique per class, so runs sharing a cluster never share an alias.
+        # Search results are matched back to the document by "<alias>*".
+        cls.alias = f"{prefix}{uuid.uuid4().hex}"
+        index = ProductDocument._index.clone(name=f"{cls.alias}-index")
+        index.create()
+        cls.addClassCleanup(
+            cls.es.options(ignore_status=404).indices.delete, index=index._name
+        )
+
+        cls.es.indices.put_alias(index=index._name, name=cls.alias)
+        ProductDocument._index._name = cls.alias
+        cls.addClassCleanup(setattr, ProductDocument._index, "_name", original_name)
+
+        ProductDocument().update(cls.products, refresh=True)
+
+    @classmethod
+    def remove_stale_indices(cls, prefix):
+        """Delete test indices left behind by crashed runs"""
+        cutoff = (time.time() - STALE_INDEX_AGE) * 1000
+        stale = [
+            name
+            for name, index in cls.es.indices.get(index=f"{prefix}*").items()
+            if int(index["settings"]["index"]["creation_date"]) < cutoff
+        ]
+        if stale:
+            cls.es.indices.delete(index=stale)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the indexed products in a single query"""
+        cls.products = Product.objects.bulk_create(
+            [Product(**data) for data in cls.index_products]
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.modified_ids = set()
+
+    def tearDown(self):
+        self.reset_documents()
+        super().tearDown()
+
+    def index_documents(self, products):
+        """Index or reindex products, restoring them after the test"""
+        ProductDocument().update(products, refresh=True)
+        self.modified_ids.update(product.pk for product in products)
+
+    def remove_documents(self, products):
+        """Remove products from the index, restoring them after the test"""
+        ProductDocument().update(products, action="delete", refresh=True)
+        self.modified_ids.update(product.pk for product in products)
+
+    def reset_documents(self):
+        """Put the documents touched by the test back to the class state"""
+        if not self.modified_ids:
+            return
+
+        self.es.delete_by_query(
+            index=self.alias,
+            query={"ids": {"values": [str(pk) for pk in self.modified_ids]}},
+            refresh=True,
+        )
+        # Class attributes hold the products as created in setUpTestData
+        originals = [
+            product
+            for product in type(self).products
+            if product.pk in self.modified_ids
+        ]
+        if originals:
+            ProductDocument().update(originals, refresh=True)
+        self.modified_ids.clear()
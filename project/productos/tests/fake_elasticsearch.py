@@ -0,0 +1,499 @@
+import json
+import re
+import time
+import unicodedata
+from fnmatch import fnmatch
+from urllib.parse import unquote
+
+from elastic_transport import (
+    ApiResponseMeta,
+    HttpHeaders,
+    NodeConfig,
+    Transport,
+    TransportApiResponse,
+)
+from elasticsearch import Elasticsearch
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+class FakeElasticsearchError(Exception):
+    def __init__(self, status, error_type, reason):
+        super().__init__(reason)
+        self.status = status
+        self.body = {
+            "error": {"type": error_type, "reason": reason},
+            "status": status,
+        }
+
+
+def unsupported(feature):
+    return FakeElasticsearchError(
+        400, "illegal_argument_exception", f"{feature} is not supported by the stand-in"
+    )
+
+
+def check_keys(kind, params, allowed):
+    extra = set(params) - set(allowed)
+    if extra:
+        raise unsupported(f"[{kind}] options {sorted(extra)}")
+
+
+def analyze(value):
+    """
+    Tokens of the standard analyzer: lowercase words
+    """
+    return TOKEN_RE.findall(str(value).lower())
+
+
+def fold(value):
+    folded = unicodedata.normalize("NFKD", value)
+    return "".join(c for c in folded if not unicodedata.combining(c))
+
+
+def required_matches(params, n_terms):
+    """
+    Number of query terms a match or multi_match needs in one field
+    """
+    if params.get("operator", "or").lower() == "and":
+        return n_terms
+    minimum = params.get("minimum_should_match", 1)
+    if isinstance(minimum, str) and re.fullmatch(r"\d+%", minimum):
+        return max(n_terms * int(minimum[:-1]) // 100, 1)
+    if isinstance(minimum, int) or (isinstance(minimum, str) and minimum.isdigit()):
+        return max(int(minimum), 1)
+    raise unsupported(f"minimum_should_match [{minimum}]")
+
+
+class FakeElasticsearchTransport(Transport):
+    """
+    In-memory stand-in for a single Elasticsearch node.
+
+    Supports the subset of the API used by the search view and its test
+    fixtures: index and alias management, bulk, delete_by_query, count and
+    search with match_all, bool, best_fields multi_match, match, term, terms,
+    range and ids queries. Text fields only support the standard analyzer and
+    keyword normalizers only lowercase and asciifolding. Anything else,
+    including query options like analyzer or fuzziness, fails loudly so tests
+    never silently pass on behavior the stand-in does not emulate.
+    """
+
+    def __init__(self):
+        self.node_config = NodeConfig("http", "localhost", 9200)
+        super().__init__([self.node_config])
+        self.indices = {}
+        self.aliases = {}
+
+    def perform_request(self, method, target, *, body=None, headers=None, **kwargs):
+        path = unquote(target.partition("?")[0])
+        parts = [part for part in path.split("/") if part]
+        try:
+            status, response = self.route(method, parts, body)
+        except FakeElasticsearchError as e:
+            status, response = e.status, e.body
+
+        meta = ApiResponseMeta(
+            status=status,
+            http_version="1.1",
+            headers=HttpHeaders(
+                {
+                    "x-elastic-product": "Elasticsearch",
+                    "content-type": "application/json",
+                }
+            ),
+            duration=0.0,
+            node=self.node_config,
+        )
+        return TransportApiResponse(meta, None if method == "HEAD" else response)
+
+    def route(self, method, parts, body):
+        if not parts:
+            return 200, {"version": {"number": "8.15.1"}}
+        if parts == ["_bulk"] or parts[1:] == ["_bulk"]:
+            return 200, self.bulk(body, parts[0] if len(parts) == 2 else None)
+        if len(parts) == 1 and method == "PUT":
+            return 200, self.create_index(parts[0], body or {})
+        if len(parts) == 1 and method == "GET":
+            return 200, self.get_indices(parts[0])
+        if len(parts) == 1 and method == "DELETE":
+            return 200, self.delete_indices(parts[0])
+        if len(parts) == 3 and parts[1] in ("_alias", "_aliases") and method == "PUT":
+            return 200, self.put_alias(parts[0], parts[2])
+        if len(parts) == 2 and parts[1] == "_search":
+            return 200, self.search(parts[0], body or {})
+        if len(parts) == 2 and parts[1] == "_count":
+            total = self.search(parts[0], body or {})["hits"]["total"]["value"]
+            return 200, {"count": total}
+        if len(parts) == 2 and parts[1] == "_delete_by_query":
+            return 200, self.delete_by_query(parts[0], body or {})
+        if len(parts) == 2 and parts[1] == "_refresh":
+            self.resolve(parts[0])
+            return 200, {"_shards": {"total": 1, "successful": 1, "failed": 0}}
+        raise FakeElasticsearchError(
+            400,
+            "illegal_argument_exception",
+            f"{method} /{'/'.join(parts)} is not supported by the stand-in",
+        )
+
+    def resolve(self, expression):
+        """
+        Concrete index names for a comma separated list of names, aliases
+        and wildcard patterns
+        """
+        names = []
+        for pattern in expression.split(","):
+            if pattern in ("_all", "*"):
+                pattern = "*"
+            matched = [
+                name
+                for name in self.indices
+                if fnmatch(name, pattern)
+                or any(fnmatch(alias, pattern) for alias in self.aliases.get(name, ()))
+            ]
+            if not matched and "*" not in pattern:
+                raise FakeElasticsearchError(
+                    404, "index_not_found_exception", f"no such index [{pattern}]"
+                )
+            names.extend(name for name in matched if name not in names)
+        return names
+
+    def write_index(self, expression):
+        if expression in self.indices:
+            return expression
+        names = [
+            name for name, aliases in self.aliases.items() if expression in aliases
+        ]
+        if len(names) > 1:
+            raise FakeElasticsearchError(
+                400,
+                "illegal_argument_exception",
+                f"alias [{expression}] has more than one index associated with it",
+            )
+        if names:
+            return names[0]
+        # Like ES, writing to a missing index creates it with dynamic mappings
+        self.create_index(expression, {})
+        return expression
+
+    def create_index(self, name, body):
+        if name in self.indices:
+            raise FakeElasticsearchError(
+                400,
+                "resource_already_exists_exception",
+                f"index [{name}] already exists",
+            )
+        self.indices[name] = {
+            "mappings": body.get("mappings", {}),
+            "settings": body.get("settings", {}),
+            "creation_date": str(int(time.time() * 1000)),
+            "documents": {},
+        }
+        self.aliases[name] = set()
+        return {"acknowledged": True, "shards_acknowledged": True, "index": name}
+
+    def get_indices(self, expression):
+        return {
+            name: {
+                "aliases": {alias: {} for alias in self.aliases[name]},
+                "mappings": self.indices[name]["mappings"],
+                "settings": {
+                    "index": {
+                        **self.indices[name]["settings"],
+                        "creation_date": self.indices[name]["creation_date"],
+                    }
+                },
+            }
+            for name in self.resolve(expression)
+        }
+
+    def delete_indices(self, expression):
+        for name in self.resolve(expression):
+            del self.indices[name]
+            del self.aliases[name]
+        return {"acknowledged": True}
+
+    def put_alias(self, expression, alias):
+        for name in self.resolve(expression):
+            self.aliases[name].add(alias)
+        return {"acknowledged": True}
+
+    def bulk(self, operations, default_index):
+        lines = [
+            json.loads(line) if isinstance(line, (str, bytes)) else line
+            for line in operations
+        ]
+        items = []
+        while lines:
+            ((action, meta),) = lines.pop(0).items()
+            name = self.write_index(meta.get("_index", default_index))
+            documents = self.indices[name]["documents"]
+            doc_id = str(meta["_id"])
+            if action in ("index", "create"):
+                source = lines.pop(0)
+                result = "updated" if doc_id in documents else "created"
+                documents[doc_id] = json.loads(json.dumps(source))
+                status = 200 if result == "updated" else 201
+            elif action == "delete":
+                result = "deleted" if documents.pop(doc_id, None) else "not_found"
+                status = 200 if result == "deleted" else 404
+            else:
+                raise FakeElasticsearchError(
+                    400,
+                    "illegal_argument_exception",
+                    f"bulk action [{action}] is not supported by the stand-in",
+                )
+            items.append(
+                {
+                    action: {
+                        "_index": name,
+                        "_id": doc_id,
+                        "result": result,
+                        "status": status,
+                    }
+                }
+            )
+        return {"took": 0, "errors": False, "items": items}
+
+    def delete_by_query(self, expression, body):
+        deleted = 0
+        for name in self.resolve(expression):
+            index = self.indices[name]
+            for doc_id, source in list(index["documents"].items()):
+                if (
+                    self.score(
+                        body.get("query", {"match_all": {}}), doc_id, source, index
+                    )
+                    is not None
+                ):
+                    del index["documents"][doc_id]
+                    deleted += 1
+        return {"took": 0, "timed_out": False, "deleted": deleted, "failures": []}
+
+    def search(self, expression, body):
+        check_keys("search", body, ["query", "from", "size"])
+
+        query = body.get("query", {"match_all": {}})
+        hits = []
+        for name in self.resolve(expression):
+            index = self.indices[name]
+            for doc_id, source in index["documents"].items():
+                score = self.score(query, doc_id, source, index)
+                if score is not None:
+                    hits.append(
+                        {
+                            "_index": name,
+                            "_id": doc_id,
+                            "_score": score,
+                            "_source": source,
+                        }
+                    )
+
+        hits.sort(key=lambda hit: -hit["_score"])
+        start = body.get("from", 0)
+        page = hits[start : start + body.get("size", 10)]
+        return {
+            "took": 0,
+            "timed_out": False,
+            "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+            "hits": {
+                "total": {"value": len(hits), "relation": "eq"},
+                "max_score": max((hit["_score"] for hit in hits), default=None),
+                "hits": json.loads(json.dumps(page)),
+            },
+        }
+
+    def field(self, index, path, source):
+        """
+        Source value and mapping of a field, resolving multi-fields like name.raw
+        """
+        name, _, sub_field = path.partition(".")
+        value = source.get(name)
+        properties = index["mappings"].get("properties", {})
+        if name in properties:
+            mapping = properties[name]
+        elif isinstance(value, str):
+            # Dynamic mapping: strings are text with a keyword multi-field
+            mapping = {"type": "text", "fields": {"keyword": {"type": "keyword"}}}
+        else:
+            mapping = {"type": "number"}
+        if sub_field:
+            mapping = mapping.get("fields", {}).get(sub_field)
+            if mapping is None:
+                return None, {}
+        return value, mapping
+
+    def terms_of(self, index, path, value, mapping):
+        """
+        Indexed terms of a field value
+        """
+        field_type = mapping.get("type", "text")
+        if field_type == "text":
+            for option in ("analyzer", "search_analyzer"):
+                if mapping.get(option, "standard") != "standard":
+                    raise unsupported(f"{option} [{mapping[option]}] of field [{path}]")
+            return set(analyze(value))
+        if field_type == "keyword":
+            return {self.normalize(index, path, value, mapping)}
+        if field_type in ("completion", "nested", "object"):
+            raise unsupported(f"{field_type} field [{path}]")
+        return {value}
+
+    def normalize(self, index, path, value, mapping):
+        name = mapping.get("normalizer")
+        if name is None or not isinstance(value, str):
+            return value
+        normalizers = index["settings"].get("analysis", {}).get("normalizer", {})
+        if name in normalizers:
+            definition = normalizers[name]
+        elif name == "lowercase":
+            definition = {"filter": ["lowercase"]}
+        else:
+            raise unsupported(f"normalizer [{name}] of field [{path}]")
+
+        filters = {"lowercase": str.lower, "asciifolding": fold}
+        if definition.get("char_filter") or not set(
+            definition.get("filter", [])
+        ) <= set(filters):
+            raise unsupported(f"normalizer [{name}] of field [{path}]")
+        for filter_name in definition["filter"]:
+            value = filters[filter_name](value)
+        return value
+
+    def score(self, query, doc_id, source, index):
+        """
+        Score of a document for a query, or None when it does not match
+        """
+        ((kind, params),) = query.items()
+
+        if kind == "match_all":
+            check_keys(kind, params, [])
+            return 1.0
+        if kind == "ids":
+            check_keys(kind, params, ["values"])
+            return 1.0 if doc_id in map(str, params["values"]) else None
+        if kind == "bool":
+            check_keys(
+                kind,
+                params,
+                ["must", "filter", "should", "must_not", "minimum_should_match"],
+            )
+            return self.score_bool(params, doc_id, source, index)
+        if kind == "multi_match":
+            check_keys(
+                kind,
+                params,
+                ["query", "fields", "type", "operator", "minimum_should_match"],
+            )
+            if params.get("type", "best_fields") != "best_fields":
+                raise unsupported(f"[multi_match] type [{params['type']}]")
+            if "fields" not in params:
+                raise unsupported("[multi_match] without fields")
+            return self.score_text(params, params["fields"], source, index)
+        if kind == "match":
+            ((path, params),) = params.items()
+            if not isinstance(params, dict):
+                params = {"query": params}
+            check_keys(kind, params, ["query", "operator", "minimum_should_match"])
+            return self.score_text(params, [path], source, index)
+        if kind in ("term", "terms"):
+            ((path, values),) = params.items()
+            if kind == "term":
+                if isinstance(values, dict):
+                    check_keys(kind, values, ["value"])
+                    values = values["value"]
+                values = [values]
+            value, mapping = self.field(index, path, source)
+            if value is None:
+                return None
+            wanted = {self.normalize(index, path, term, mapping) for term in values}
+            indexed = self.terms_of(index, path, value, mapping)
+            return 1.0 if indexed & wanted else None
+        if kind == "range":
+            ((path, bounds),) = params.items()
+            check_keys(kind, bounds, ["gt", "gte", "lt", "lte"])
+            value, _ = self.field(index, path, source)
+            if value is None:
+                return None
+            checks = {
+                "gt": lambda bound: value > bound,
+                "gte": lambda bound: value >= bound,
+                "lt": lambda bound: value < bound,
+                "lte": lambda bound: value <= bound,
+            }
+            matched = all(checks[op](bound) for op, bound in bounds.items())
+            return 1.0 if matched else None
+
+        raise FakeElasticsearchError(
+            400,
+            "parsing_exception",
+            f"[{kind}] query is not supported by the stand-in",
+        )
+
+    def score_bool(self, params, doc_id, source, index):
+        def clauses(name):
+            value = params.get(name, [])
+            return value if isinstance(value, list) else [value]
+
+        total = 0.0
+        for clause in clauses("must"):
+            score = self.score(clause, doc_id, source, index)
+            if score is None:
+                return None
+            total += score
+        for clause in clauses("filter"):
+            if self.score(clause, doc_id, source, index) is None:
+                return None
+        for clause in clauses("must_not"):
+            if self.score(clause, doc_id, source, index) is not None:
+                return None
+
+        should = [
+            score
+            for score in (
+                self.score(clause, doc_id, source, index)
+                for clause in clauses("should")
+            )
+            if score is not None
+        ]
+        if "minimum_should_match" in params:
+            required = required_matches(params, len(clauses("should")))
+        elif clauses("must") or clauses("filter"):
+            required = 0
+        else:
+            required = min(len(clauses("should")), 1)
+        if len(should) < required:
+            return None
+        return total + sum(should)
+
+    def score_text(self, params, fields, source, index):
+        """
+        best_fields scoring: the best boosted share of query terms in one field
+        """
+        terms = analyze(params["query"])
+        if not terms:
+            return None
+        required = required_matches(params, len(terms))
+
+        best = None
+        for spec in fields:
+            path, _, boost = spec.partition("^")
+            value, mapping = self.field(index, path, source)
+            if mapping.get("type", "text") != "text":
+                raise unsupported(
+                    f"full-text query on {mapping['type']} field [{path}]"
+                )
+            if value is None:
+                continue
+            indexed = self.terms_of(index, path, value, mapping)
+            matched = sum(1 for term in terms if term in indexed)
+            if matched >= required:
+                score = float(boost or 1) * matched / len(terms)
+                best = score if best is None else max(best, score)
+        return best
+
+
+def fake_elasticsearch():
+    """
+    Elasticsearch client backed by a fresh in-memory stand-in
+    """
+    return Elasticsearch(_transport=FakeElasticsearchTransport())
@@ -0,0 +1,76 @@
+from ..documents import ProductDocument
+from ..models import Product
+from .base import SearchIndexTestCase
+
+
+class SearchIndexTestCaseTestCase(SearchIndexTestCase):
+    index_products = [
+        {
+            "name": "Gaming Laptop",
+            "description": "High-end gaming laptop",
+            "category": "Electronics",
+            "price": 1500.00,
+            "stock": 10,
+        },
+        {
+            "name": "LED Monitor",
+            "description": "27-inch LED monitor",
+            "category": "Electronics",
+            "price": 300.00,
+            "stock": 0,
+        },
+        {
+            "name": "Mechanical Keyboard",
+            "description": "Gaming keyboard with blue switches",
+            "category": "Peripherals",
+            "price": 100.00,
+            "stock": 5,
+        },
+    ]
+
+    def indexed_documents(self):
+        response = ProductDocument.search()[:100].execute()
+        return sorted(
+            (
+                {
+                    "name": hit.name,
+                    "description": hit.description,
+                    "category": hit.category,
+                    "price": hit.price,
+                    "stock": hit.stock,
+                }
+                for hit in response
+            ),
+            key=lambda document: document["name"],
+        )
+
+    def test_index_is_behind_class_alias(self):
+        """Test ProductDocument points at a single index through the alias"""
+        self.assertEqual(ProductDocument._index._name, self.alias)
+        self.assertEqual(len(self.es.indices.get(index=self.alias)), 1)
+
+    def test_reset_restores_modified_documents(self):
+        """Test reset puts the index back to exactly index_products"""
+        _, monitor, keyboard = self.products
+        monitor.name = "Curved Monitor"
+        monitor.stock = 42
+        monitor.save()
+        extra = Product.objects.create(
+            name="Gaming Mouse",
+            description="Wireless gaming mouse",
+            category="Peripherals",
+            price=80.00,
+            stock=7,
+        )
+
+        self.index_documents([monitor, extra])
+        self.remove_documents([keyboard])
+        self.assertNotEqual(self.indexed_documents(), self.index_products)
+
+        self.reset_documents()
+        self.assertEqual(ProductDocument.search().count(), len(self.index_products))
+        self.assertEqual(
+            self.indexed_documents(),
+            sorted(self.index_products, key=lambda document: document["name"]),
+        )
+        self.assertEqual(self.modified_ids, set())
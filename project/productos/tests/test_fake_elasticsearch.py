@@ -0,0 +1,108 @@
+from django.test import SimpleTestCase
+from elasticsearch.exceptions import BadRequestError, NotFoundError
+from .fake_elasticsearch import fake_elasticsearch
+
+
+class FakeElasticsearchTestCase(SimpleTestCase):
+    def setUp(self):
+        self.es = fake_elasticsearch()
+        self.es.indices.create(
+            index="products-a",
+            settings={
+                "analysis": {
+                    "normalizer": {
+                        "folded": {
+                            "type": "custom",
+                            "filter": ["lowercase", "asciifolding"],
+                        }
+                    }
+                }
+            },
+            mappings={
+                "properties": {
+                    "name": {"type": "text", "analyzer": "spanish"},
+                    "description": {"type": "text"},
+                    "category": {"type": "keyword", "normalizer": "folded"},
+                }
+            },
+        )
+        self.es.indices.create(index="products-b")
+        self.es.indices.put_alias(index="products-a", name="products")
+
+    def index(self, index, doc_id, document):
+        return self.es.bulk(
+            operations=[{"index": {"_index": index, "_id": doc_id}}, document]
+        )
+
+    def test_resolve_names_aliases_and_patterns(self):
+        """Test index expressions resolve to concrete indices"""
+        self.assertEqual(set(self.es.indices.get(index="products")), {"products-a"})
+        self.assertEqual(
+            set(self.es.indices.get(index="products-*")), {"products-a", "products-b"}
+        )
+        self.assertEqual(dict(self.es.indices.get(index="missing-*")), {})
+        with self.assertRaises(NotFoundError):
+            self.es.indices.get(index="missing")
+
+    def test_bulk_writes_through_alias(self):
+        """Test bulk writes through an alias land in its index"""
+        self.index("products", 1, {"description": "blue switches"})
+
+        response = self.es.search(index="products-a", query={"match_all": {}})
+        self.assertEqual(response["hits"]["hits"][0]["_index"], "products-a")
+        self.assertEqual(response["hits"]["total"]["value"], 1)
+
+    def test_bulk_to_alias_with_two_indices_fails(self):
+        """Test writing through an ambiguous alias is rejected"""
+        self.es.indices.put_alias(index="products-b", name="products")
+        with self.assertRaises(BadRequestError):
+            self.index("products", 1, {"description": "blue switches"})
+
+    def test_bulk_delete(self):
+        """Test bulk deletes report not_found for missing documents"""
+        response = self.es.bulk(
+            operations=[{"delete": {"_index": "products-a", "_id": "1"}}]
+        )
+        self.assertEqual(response["items"][0]["delete"]["status"], 404)
+        self.assertEqual(response["items"][0]["delete"]["result"], "not_found")
+
+        self.index("products-a", 1, {"description": "blue switches"})
+        response = self.es.bulk(
+            operations=[{"delete": {"_index": "products-a", "_id": "1"}}]
+        )
+        self.assertEqual(response["items"][0]["delete"]["status"], 200)
+        self.assertEqual(self.es.count(index="products-a")["count"], 0)
+
+    def test_keyword_normalizer(self):
+        """Test term queries apply the keyword normalizer"""
+        self.index("products-a", 1, {"category": "Electrónica"})
+
+        response = self.es.search(
+            index="products", query={"term": {"category": "ELECTRONICA"}}
+        )
+        self.assertEqual(response["hits"]["total"]["value"], 1)
+
+    def test_unsupported_text_options_fail(self):
+        """Test options the stand-in does not emulate are rejected"""
+        self.index("products-a", 1, {"name": "Teclado", "description": "luces"})
+        queries = [
+            {
+                "multi_match": {
+                    "query": "luces",
+                    "fields": ["description"],
+                    "type": "phrase",
+                }
+            },
+            {
+                "multi_match": {
+                    "query": "luces",
+                    "fields": ["description"],
+                    "analyzer": "spanish",
+                }
+            },
+            {"match": {"description": {"query": "luces", "fuzziness": "AUTO"}}},
+            {"match": {"name": "teclado"}},
+        ]
+        for query in queries:
+            with self.subTest(query=query), self.assertRaises(BadRequestError):
+                self.es.search(index="products", query=query)
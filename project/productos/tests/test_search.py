@@ -1,72 +1,54 @@
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
-from elasticsearch_dsl import Index
 from unittest.mock import patch, Mock
-from ..models import Product
-from ..documents import ProductDocument
 from elasticsearch.exceptions import ConnectionError
+from .base import SearchIndexTestCase, requires_live_elasticsearch
 
 
-class SearchProductsTestCase(TestCase):
+class SearchProductsTestCase(SearchIndexTestCase):
+    index_products = [
+        {
+            "name": "Gaming Laptop",
+            "description": "High-end gaming laptop",
+            "category": "Electronics",
+            "price": 1500.00,
+            "stock": 10,
+        },
+        {
+            "name": "LED Monitor",
+            "description": "27-inch LED monitor",
+            "category": "Electronics",
+            "price": 300.00,
+            "stock": 0,
+        },
+        {
+            "name": "Mechanical Keyboard",
+            "description": "Gaming keyboard with blue switches",
+            "category": "Peripherals",
+            "price": 100.00,
+            "stock": 5,
+        },
+    ]
+
     @classmethod
     def setUpTestData(cls):
         """Set up non-modified objects used by all test methods"""
+        super().setUpTestData()
         cls.url = reverse("search-products")
-        cls.test_products = [
-            {
-                "name": "Gaming Laptop",
-                "description": "High-end gaming laptop",
-                "category": "Electronics",
-                "price": 1500.00,
-                "stock": 10,
-            },
-            {
-                "name": "LED Monitor",
-                "description": "27-inch LED monitor",
-                "category": "Electronics",
-                "price": 300.00,
-                "stock": 0,
-            },
-            {
-                "name": "Mechanical Keyboard",
-                "description": "Gaming keyboard with blue switches",
-                "category": "Peripherals",
-                "price": 100.00,
-                "stock": 5,
-            },
-        ]
 
     def setUp(self):
         """Setup for each test"""
+        super().setUp()
         self.client = APIClient()
 
-        # Clear and recreate the index
-        index = Index("products")
-        index.delete(ignore=404)
-        index.create()
-
-        # Create and index test products
-        self.products = []
-        for product_data in self.test_products:
-            product = Product.objects.create(**product_data)
-            self.products.append(product)
-
-        # Index products and force refresh
-        ProductDocument().update(self.products)
-        index.refresh()
-
-    def tearDown(self):
-        """Cleanup after each test"""
-        Product.objects.all().delete()
-        Index("products").delete(ignore=404)
-
     def test_basic_search_empty_query(self):
         """Test search with empty query returns all products"""
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data["results"]), len(self.test_products))
+        self.assertEqual(len(response.data["results"]), len(self.index_products))
 
+    @requires_live_elasticsearch
     def test_basic_search_with_query(self):
         """Test basic text search with specific query"""
         response = self.client.get(self.url, {"query": "gaming"})
@@ -88,9 +70,6 @@ class SearchProductsTestCase(TestCase):
 
     def test_search_by_category_exact_match(self):
         """Test filtering by category with exact match"""
-        # Ensure index is ready
-        Index("products").refresh()
-
         response = self.client.get(self.url, {"category": "Peripherals"})
         self.assertEqual(response.status_code, 200)
 
@@ -110,6 +89,17 @@ class SearchProductsTestCase(TestCase):
         self.assertTrue(len(results) > 0)
         self.assertTrue(all(r["stock"] > 0 for r in results))
 
+    def test_search_reflects_reindexed_product(self):
+        """Test reindexed products are searchable with their new values"""
+        monitor = self.products[1]
+        monitor.stock = 4
+        monitor.save()
+        self.index_documents([monitor])
+
+        response = self.client.get(self.url, {"available": "true"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), len(self.index_products))
+
     def test_price_range_search(self):
         """Test search with various price range scenarios"""
         test_cases = [
@@ -154,11 +144,25 @@ class SearchProductsTestCase(TestCase):
                 f"Failed for invalid input: {case}",
             )
 
+    def test_combined_filters_without_query(self):
+        """Test combination of filters without a text query"""
+        params = {"category": "electronics", "price_max": "1000", "available": "true"}
+
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"], [])
+
+        params["price_max"] = "2000"
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result["name"] for result in response.data["results"]],
+            ["Gaming Laptop"],
+        )
+
+    @requires_live_elasticsearch
     def test_combined_search_filters(self):
         """Test combination of multiple search filters"""
-        # Ensure index is ready
-        Index("products").refresh()
-
         params = {
             "query": "gaming",
             "category": "Electronics",
@@ -177,6 +181,17 @@ class SearchProductsTestCase(TestCase):
             self.assertEqual(result["category"], "Electronics")
             self.assertGreater(result["stock"], 0)
 
+
+class SearchProductsErrorTestCase(TestCase):
+    """Error handling tests that mock the search and need no index"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.url = reverse("search-products")
+
+    def setUp(self):
+        self.client = APIClient()
+
     @patch("elasticsearch_dsl.Search.execute")
     def test_elasticsearch_connection_error(self, mock_execute):
         """Test handling of Elasticsearch connection errors"""
@@ -0,0 +1,205 @@
+import io
+import random
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from ..models import Product, ProductSimilarity
+from ..similarity import compute_similar_products
+
+
+@override_settings(ELASTICSEARCH_DSL_AUTOSYNC=False)
+class SimilarProductsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the catalog shared by all test methods"""
+        cls.laptop = Product.objects.create(
+            name="Gaming Laptop",
+            description="High-end gaming laptop",
+            category="Electronics",
+            price=1500.00,
+            stock=10,
+        )
+        cls.gaming_notebook = Product.objects.create(
+            name="Gaming Notebook",
+            description="Gaming laptop with RGB keyboard",
+            category="Electronics",
+            price=1400.00,
+            stock=3,
+        )
+        cls.monitor = Product.objects.create(
+            name="LED Monitor",
+            description="27-inch LED monitor",
+            category="Electronics",
+            price=300.00,
+            stock=0,
+        )
+        cls.keyboard = Product.objects.create(
+            name="Mechanical Keyboard",
+            description="Gaming keyboard with blue switches",
+            category="Peripherals",
+            price=100.00,
+            stock=5,
+        )
+
+    def setUp(self):
+        """Setup for each test"""
+        self.client = APIClient()
+
+    def neighbor_ids(self, product):
+        return [
+            product_id
+            for product_id, _ in ProductSimilarity.objects.get(pk=product.pk).neighbors
+        ]
+
+    def test_full_compute_ranks_similar_products(self):
+        """Test every product gets a ranked list that excludes itself"""
+        updated = compute_similar_products(full=True, top_k=2)
+        self.assertEqual(updated, Product.objects.count())
+
+        neighbors = self.neighbor_ids(self.laptop)
+        self.assertEqual(len(neighbors), 2)
+        self.assertNotIn(self.laptop.pk, neighbors)
+        self.assertEqual(neighbors[0], self.gaming_notebook.pk)
+
+    def test_chunk_size_does_not_change_results(self):
+        """Test chunked scoring matches scoring the catalog at once"""
+        compute_similar_products(full=True, chunk_size=1)
+        chunked = dict(ProductSimilarity.objects.values_list("pk", "neighbors"))
+        compute_similar_products(full=True, chunk_size=100)
+        whole = dict(ProductSimilarity.objects.values_list("pk", "neighbors"))
+        self.assertEqual(chunked, whole)
+
+    def test_incremental_compute_only_touches_changes(self):
+        """Test a second run only rescores changed products"""
+        compute_similar_products()
+        self.assertEqual(compute_similar_products(), 0)
+
+        self.monitor.name = "Gaming Laptop Pro"
+        self.monitor.description = "High-end gaming laptop"
+        self.monitor.price = 1500.00
+        self.monitor.save()
+
+        self.assertGreaterEqual(compute_similar_products(top_k=2), 1)
+        self.assertEqual(self.neighbor_ids(self.laptop)[0], self.monitor.pk)
+
+    def test_incremental_compute_matches_full_after_edit(self):
+        """Test a neighbor edited into something unrelated gets replaced"""
+        Product.objects.create(
+            name="Gaming Headset",
+            description="Gaming headset with microphone",
+            category="Electronics",
+            price=120.00,
+            stock=8,
+        )
+        compute_similar_products(top_k=2)
+        self.assertIn(self.gaming_notebook.pk, self.neighbor_ids(self.laptop))
+
+        self.gaming_notebook.name = "Lawn Mower"
+        self.gaming_notebook.description = "Petrol lawn mower for large gardens"
+        self.gaming_notebook.category = "Garden"
+        self.gaming_notebook.save()
+
+        compute_similar_products(top_k=2)
+        incremental = {
+            product.pk: self.neighbor_ids(product)
+            for product in Product.objects.all()
+        }
+        compute_similar_products(full=True, top_k=2)
+        full = {
+            product.pk: self.neighbor_ids(product)
+            for product in Product.objects.all()
+        }
+        self.assertEqual(incremental, full)
+        self.assertNotIn(self.gaming_notebook.pk, incremental[self.laptop.pk])
+
+    def test_incremental_compute_refreshes_stored_scores(self):
+        """Test lists never keep a stale score for a rescored product"""
+        words = [
+            "gaming", "laptop", "monitor", "keyboard", "mouse", "chair",
+            "desk", "lamp", "cable", "wireless", "office", "silent",
+        ]
+        rng = random.Random(0)
+
+        def randomize(product):
+            product.name = " ".join(rng.sample(words, 2))
+            product.description = " ".join(rng.sample(words, 4))
+            product.category = rng.choice(["Electronics", "Peripherals", "Office"])
+            product.price = rng.randint(10, 2000)
+
+        for _ in range(40):
+            product = Product(stock=1)
+            randomize(product)
+            product.save()
+        products = list(Product.objects.all())
+        compute_similar_products(top_k=3)
+
+        for _ in range(3):
+            for product in rng.sample(products, 3):
+                randomize(product)
+                product.save()
+            compute_similar_products(top_k=3)
+
+            # Scores are symmetric, so a pair stored on both sides must agree
+            stored = {
+                product_id: dict(neighbors)
+                for product_id, neighbors in ProductSimilarity.objects.values_list(
+                    "pk", "neighbors"
+                )
+            }
+            for product_id, neighbors in stored.items():
+                for neighbor_id, score in neighbors.items():
+                    if product_id in stored[neighbor_id]:
+                        self.assertEqual(stored[neighbor_id][product_id], score)
+
+    def test_incremental_compute_rebuilds_lists_for_new_top_k(self):
+        """Test raising top_k between incremental runs fills every list"""
+        compute_similar_products(top_k=1)
+        compute_similar_products(top_k=3)
+
+        for product in Product.objects.all():
+            self.assertEqual(len(self.neighbor_ids(product)), 3)
+
+    def test_incremental_compute_includes_new_products(self):
+        """Test a new product shows up in the lists of existing products"""
+        compute_similar_products(top_k=1)
+        mouse = Product.objects.create(
+            name="Gaming Mouse",
+            description="Gaming mouse with blue switches",
+            category="Peripherals",
+            price=90.00,
+            stock=7,
+        )
+
+        compute_similar_products(top_k=1)
+        self.assertEqual(self.neighbor_ids(self.keyboard), [mouse.pk])
+        self.assertEqual(self.neighbor_ids(mouse), [self.keyboard.pk])
+
+    def test_command(self):
+        """Test the management command fills the lookup table"""
+        call_command("compute_similar_products", "--full", stdout=io.StringIO())
+        self.assertEqual(ProductSimilarity.objects.count(), Product.objects.count())
+
+    def test_similar_products_endpoint(self):
+        """Test the endpoint serves the precomputed ranking"""
+        compute_similar_products(top_k=3)
+        deleted_id = str(self.gaming_notebook.pk)
+        self.gaming_notebook.delete()
+
+        url = reverse("similar-products", args=[self.laptop.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        results = response.data["results"]
+        self.assertEqual(response.data["total"], 2)
+        self.assertNotIn(deleted_id, [result["id"] for result in results])
+        self.assertEqual(
+            set(results[0].keys()),
+            {"id", "name", "description", "category", "price", "stock", "score"},
+        )
+
+    def test_similar_products_endpoint_not_found(self):
+        """Test unknown products return 404"""
+        response = self.client.get(reverse("similar-products", args=[999999]))
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("error", response.data)
@@ -1,8 +1,13 @@
 from django.urls import path
-from .views import ReadmeView, search_products
+from .views import ReadmeView, search_products, similar_products
 
 
 urlpatterns = [
     path("api/search/", search_products, name="search-products"),
+    path(
+        "api/products/<int:pk>/similar/",
+        similar_products,
+        name="similar-products",
+    ),
     path('', ReadmeView.as_view(), name='readme'),
 ]
@@ -5,6 +5,7 @@ from elasticsearch.exceptions import ConnectionError as ESConnectionError
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from .documents import ProductDocument
+from .models import Product, ProductSimilarity
 
 
 class ReadmeView(View):
@@ -111,3 +112,38 @@ def search_products(request):
         )
     except Exception as e:
         return Response({"error": f"Internal server error: {str(e)}"}, status=500)
+
+
+@api_view(["GET"])
+def similar_products(request, pk):
+    """
+    View for the precomputed similar products of a product
+    """
+    try:
+        similarity = ProductSimilarity.objects.get(pk=pk)
+    except ProductSimilarity.DoesNotExist:
+        return Response({"error": "No similar products for this product"}, status=404)
+
+    products = Product.objects.in_bulk(
+        [product_id for product_id, _ in similarity.neighbors]
+    )
+
+    # Keep the precomputed ranking, skipping products deleted since the last run
+    results = []
+    for product_id, score in similarity.neighbors:
+        product = products.get(product_id)
+        if product is None:
+            continue
+        results.append(
+            {
+                "id": str(product.pk),
+                "name": product.name,
+                "description": product.description,
+                "category": product.category,
+                "price": float(product.price),
+                "stock": product.stock,
+                "score": score,
+            }
+        )
+
+    return Response({"total": len(results), "results": results})
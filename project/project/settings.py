@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -84,7 +85,9 @@ DATABASES = {
     }
 }
 ELASTICSEARCH_DSL = {
-    "default": {"hosts": "http://localhost:9200"},
+    "default": {
+        "hosts": os.environ.get("ELASTICSEARCH_HOSTS", "http://localhost:9200")
+    },
 }
 
 # Password validation